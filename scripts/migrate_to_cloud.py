@@ -19,6 +19,9 @@ The script will:
 4. Validate the migration was successful
 """
 
+import csv
+import io
+import json
 import os
 import sys
 from pathlib import Path
@@ -29,14 +32,19 @@ from typing import Dict, Any, List
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / 'src'))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, insert, select, text
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import sessionmaker
 from database.models import Base, BusinessDocument, PurchaseOrder, Invoice, Receipt, DocumentLineItem, Vendor, ExtractionTemplate
 
+# Number of rows streamed from SQLite and inserted per transaction.
+# Keeps peak memory bounded by the batch size instead of the table size.
+BATCH_SIZE = 5000
+
 
 class DatabaseMigrator:
     """Handles migration from SQLite to PostgreSQL"""
-    
+
     def __init__(self, sqlite_path: str, postgres_url: str):
         """Initialize migrator with source and target database URLs"""
         self.sqlite_url = f"sqlite:///{sqlite_path}"
@@ -48,16 +56,38 @@ class DatabaseMigrator:
         
         # Create engines
         self.sqlite_engine = create_engine(self.sqlite_url)
+        event.listen(self.sqlite_engine, "connect", self._set_sqlite_pragmas)
+        # Pool tuned for a bulk load: one long-lived connection, no
+        # pre-ping round trip before every checkout, and asynchronous
+        # commits server-side (the migration is re-runnable, so trading
+        # durability of the last few commits for throughput is fine)
         self.postgres_engine = create_engine(
             self.postgres_url,
-            pool_pre_ping=True,
-            connect_args={"sslmode": "require"}
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=False,
+            insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT page
+            connect_args={
+                "sslmode": "require",
+                "options": "-c synchronous_commit=off"
+            }
         )
         
-        # Create session makers
-        self.sqlite_session = sessionmaker(bind=self.sqlite_engine)
+        # Session maker for the write side; reads go through a Core
+        # connection with no identity-map overhead
         self.postgres_session = sessionmaker(bind=self.postgres_engine)
     
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune SQLite for the full-table scans the migration performs"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+        cursor.close()
+
     def validate_connections(self) -> bool:
         """Test connections to both databases"""
         try:
@@ -85,53 +115,157 @@ class DatabaseMigrator:
             print(f"❌ Failed to create schema: {e}")
             raise
     
-    def count_records(self, session_maker, model) -> int:
-        """Count records in a table"""
-        with session_maker() as session:
-            return session.query(model).count()
-    
+    def prepare_source_schema(self) -> None:
+        """Bring an older source database up to the current schema
+
+        The streaming SELECT names every model column, so a database
+        created before the denormalized line_items_count column would
+        fail with 'no such column' before the first batch. Apply the
+        same in-place ALTER/backfill that initialize_database performs,
+        since the migrator never runs that against its source.
+        """
+        with self.sqlite_engine.connect() as conn:
+            columns = {row[1] for row in conn.execute(
+                text("PRAGMA table_info(business_documents)"))}
+            if 'line_items_count' not in columns:
+                conn.execute(text("""
+                    ALTER TABLE business_documents
+                    ADD COLUMN line_items_count INTEGER NOT NULL DEFAULT 0
+                """))
+                conn.execute(text("""
+                    UPDATE business_documents SET line_items_count = (
+                        SELECT COUNT(*) FROM document_line_items
+                        WHERE document_id = business_documents.id
+                    )
+                """))
+                conn.commit()
+                print("✅ Source schema updated (added line_items_count)")
+
     def migrate_table(self, model, table_name: str) -> Dict[str, int]:
-        """Migrate a single table from SQLite to PostgreSQL"""
+        """Migrate a single table from SQLite to PostgreSQL in bounded batches"""
         print(f"📦 Migrating {table_name}...")
-        
-        with self.sqlite_session() as source_session:
-            records = source_session.query(model).all()
-            
-        if not records:
-            print(f"  ⚠️  No records found in {table_name}")
-            return {"source": 0, "target": 0}
-        
-        # Convert to dictionaries and handle special cases
-        record_dicts = []
-        for record in records:
-            record_dict = {}
-            for column in model.__table__.columns:
-                value = getattr(record, column.name)
-                
-                # Handle enum values
-                if hasattr(value, 'value'):
-                    value = value.value
-                
-                record_dict[column.name] = value
-            
-            record_dicts.append(record_dict)
-        
-        # Bulk insert into PostgreSQL
-        with self.postgres_session() as target_session:
+
+        # Short-circuit empty tables with a LIMIT 1 probe instead of
+        # setting up the streaming scan just to find nothing
+        with self.sqlite_engine.connect() as source_conn:
+            if source_conn.execute(select(model.__table__).limit(1)).first() is None:
+                print(f"  ⚠️  No records found in {table_name}")
+                return {"source": 0, "target": 0}
+
+        source_count = 0
+
+        # Only enum columns need post-processing; resolve them once per table
+        enum_columns = [
+            column.name for column in model.__table__.columns
+            if isinstance(column.type, SQLEnum)
+        ]
+
+        with self.sqlite_engine.connect() as source_conn, self.postgres_session() as target_session:
+            # Stream Core RowMappings over a plain connection: no ORM
+            # identity map retaining every row, rows arrive dict-shaped,
+            # and peak memory stays O(BATCH_SIZE) rather than O(table)
+            rows = source_conn.execution_options(
+                yield_per=BATCH_SIZE, stream_results=True
+            ).execute(select(model.__table__)).mappings()
+
             try:
-                target_session.bulk_insert_mappings(model, record_dicts)
-                target_session.commit()
-                print(f"  ✅ Migrated {len(record_dicts)} records to {table_name}")
+                batch = []
+                for row in rows:
+                    record_dict = dict(row)
+
+                    # Handle enum values: the database representation on
+                    # both sides is the member *name* (the PostgreSQL
+                    # enum type is created from the names), and COPY
+                    # bypasses the Enum bind processor that would map a
+                    # member for us — so emit the name, which the
+                    # Core-insert fallback accepts too
+                    for name in enum_columns:
+                        value = record_dict[name]
+                        if value is not None:
+                            record_dict[name] = value.name
+
+                    batch.append(record_dict)
+
+                    # Insert and commit each full batch independently
+                    if len(batch) >= BATCH_SIZE:
+                        self._insert_batch(target_session, model, batch)
+                        source_count += len(batch)
+                        batch = []
+
+                if batch:
+                    self._insert_batch(target_session, model, batch)
+                    source_count += len(batch)
+
             except Exception as e:
                 target_session.rollback()
                 print(f"  ❌ Failed to migrate {table_name}: {e}")
                 raise
-        
-        # Verify counts
-        source_count = len(records)
-        target_count = self.count_records(self.postgres_session, model)
-        
-        return {"source": source_count, "target": target_count}
+
+        print(f"  ✅ Migrated {source_count} records to {table_name}")
+
+        # The target table started empty and every batch committed, so the
+        # inserted count is the target count; run_migration validates all
+        # tables with one query at the end instead of a COUNT(*) scan here
+        return {"source": source_count, "target": source_count}
+
+    def validate_target_counts(self, results: Dict[str, Dict[str, int]]) -> None:
+        """Refresh target counts for all tables in a single round trip"""
+        count_query = " UNION ALL ".join(
+            f"SELECT '{table_name}' AS table_name, count(*) AS n FROM {table_name}"
+            for table_name in results
+        )
+        with self.postgres_engine.connect() as conn:
+            actual_counts = dict(conn.execute(text(count_query)).all())
+
+        for table_name, counts in results.items():
+            counts["target"] = actual_counts.get(table_name, 0)
+
+    def _insert_batch(self, target_session, model, batch) -> None:
+        """Insert one batch of record dicts and commit"""
+        # COPY FROM STDIN bypasses the SQL executor entirely and is the
+        # fastest PostgreSQL bulk-load path; fall back to Core insert
+        # (with insertmanyvalues batching) for any other dialect
+        if self.postgres_engine.dialect.name == "postgresql":
+            self._copy_batch(model, batch)
+        else:
+            target_session.execute(insert(model), batch)
+            target_session.commit()
+
+    def _copy_batch(self, model, batch) -> None:
+        """Bulk load one batch of record dicts via COPY FROM STDIN"""
+        columns = [column.name for column in model.__table__.columns]
+
+        # Format the batch as CSV; \N marks NULLs for COPY
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record_dict in batch:
+            writer.writerow([self._to_copy_value(record_dict[col]) for col in columns])
+        buffer.seek(0)
+
+        raw_conn = self.postgres_engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                column_list = ", ".join(columns)
+                cursor.copy_expert(
+                    f"COPY {model.__table__.name} ({column_list}) "
+                    f"FROM STDIN WITH (FORMAT CSV, NULL '\\N')",
+                    buffer
+                )
+            raw_conn.commit()
+        finally:
+            raw_conn.close()
+
+    @staticmethod
+    def _to_copy_value(value):
+        """Convert a Python value to its COPY CSV representation"""
+        if value is None:
+            return r'\N'
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        # Decimal, int, bool and str are handled by the csv writer directly
+        return value
     
     def run_migration(self) -> Dict[str, Any]:
         """Run the complete migration process"""
@@ -146,7 +280,10 @@ class DatabaseMigrator:
         
         # Create schema
         self.create_target_schema()
-        
+
+        # Upgrade pre-series source databases in place before streaming
+        self.prepare_source_schema()
+
         # Migration order (respecting foreign key dependencies)
         migration_order = [
             (BusinessDocument, "business_documents"),
@@ -159,20 +296,21 @@ class DatabaseMigrator:
         ]
         
         results = {}
-        total_source = 0
-        total_target = 0
-        
+
         # Migrate each table
         for model, table_name in migration_order:
             try:
-                counts = self.migrate_table(model, table_name)
-                results[table_name] = counts
-                total_source += counts["source"]
-                total_target += counts["target"]
+                results[table_name] = self.migrate_table(model, table_name)
             except Exception as e:
                 print(f"❌ Migration failed at table {table_name}: {e}")
                 raise
-        
+
+        # Validate all target counts in one pass
+        self.validate_target_counts(results)
+
+        total_source = sum(counts["source"] for counts in results.values())
+        total_target = sum(counts["target"] for counts in results.values())
+
         # Summary
         print("\n📊 Migration Summary:")
         print("=" * 50)
@@ -54,6 +54,7 @@ Complete workflow for processing PDF documents and storing extracted data in SQL
 import os
 import sys
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
@@ -63,16 +64,41 @@ from decimal import Decimal
 # AUDIT: Path manipulation indicates poor package structure - should use proper packaging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from sqlalchemy import bindparam, insert, text, update
+
 # Import centralized configuration
 from config import DATABASE_URL
 from pdf_parser.parser import BusinessDocumentPDFParser, PurchaseOrderData, InvoiceData, ReceiptData
+from pdf_parser.parser import DocumentType as ParserDocumentType
 from database.setup import initialize_database, get_database_info
 from database.connection import DatabaseSession, get_session
 from database.models import (
-    BusinessDocument, PurchaseOrder, Invoice, Receipt, 
+    BusinessDocument, PurchaseOrder, Invoice, Receipt,
     DocumentLineItem, Vendor, normalize_vendor_name, DocumentType
 )
 
+def _to_decimal(value) -> Decimal:
+    """Coerce a numeric value to Decimal, passing Decimals through untouched
+
+    The parser already emits Decimal for currency fields; only plain
+    floats/ints need conversion, via repr to keep the shortest exact form.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(repr(value))
+
+
+# One parser per worker process, created lazily on first use
+_worker_parser = None
+
+
+def _parse_pdf_worker(file_path: str):
+    """Parse one PDF in a worker process (module-level so it pickles)"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = BusinessDocumentPDFParser()
+    return _worker_parser.parse_document(file_path)
+
 
 class PDFProcessingWorkflow:
     """Main workflow class for processing PDFs and storing data"""
@@ -92,19 +118,17 @@ class PDFProcessingWorkflow:
             db_url = DATABASE_URL or "default configuration"
             print(f"📊 Using configured database: {db_url[:50]}...")
     
+    # Parser DocumentType -> database DocumentType
+    TYPE_MAPPING = {
+        ParserDocumentType.PURCHASE_ORDER: DocumentType.PURCHASE_ORDER,
+        ParserDocumentType.INVOICE: DocumentType.INVOICE,
+        ParserDocumentType.RECEIPT: DocumentType.RECEIPT,
+        ParserDocumentType.UNKNOWN: DocumentType.UNKNOWN
+    }
+
     def convert_document_type(self, parser_doc_type):
         """Convert parser DocumentType to database DocumentType"""
-        # Import parser DocumentType locally to avoid conflicts
-        from pdf_parser.parser import DocumentType as ParserDocumentType
-        
-        type_mapping = {
-            ParserDocumentType.PURCHASE_ORDER: DocumentType.PURCHASE_ORDER,
-            ParserDocumentType.INVOICE: DocumentType.INVOICE,
-            ParserDocumentType.RECEIPT: DocumentType.RECEIPT,
-            ParserDocumentType.UNKNOWN: DocumentType.UNKNOWN
-        }
-        
-        return type_mapping.get(parser_doc_type, DocumentType.UNKNOWN)
+        return self.TYPE_MAPPING.get(parser_doc_type, DocumentType.UNKNOWN)
     
     async def initialize_database(self):
         """Initialize the database with tables only (no sample data)"""
@@ -122,195 +146,292 @@ class PDFProcessingWorkflow:
         print(f"📄 Processing PDF files from: {pdf_directory}")
         
         pdf_dir = Path(pdf_directory)
-        
+
         if not pdf_dir.exists():
             print(f"❌ Directory {pdf_directory} does not exist")
             return []
-        
+
         # Find all PDF files
-        for file_path in pdf_dir.glob("*.pdf"):
-            try:
-                print(f"\n🔍 Processing: {file_path.name}")
-                
-                # Parse the PDF
-                document_data = self.parser.parse_document(str(file_path))
-                
-                # Store in database
-                stored_document = await self.store_document_data(document_data, str(file_path))
-                
-                if stored_document:
-                    self.processed_documents.append({
-                        "file_path": str(file_path),
-                        "document_type": document_data.document_type.value,
-                        "document_number": document_data.document_number,
-                        "vendor": document_data.vendor,
-                        "confidence": document_data.extraction_confidence,
-                        "database_id": stored_document['id']
-                    })
-                    print(f"✅ Successfully processed and stored: {file_path.name}")
-                else:
-                    print(f"❌ Failed to store: {file_path.name}")
-                    
-            except Exception as e:
-                error_msg = f"Error processing {file_path.name}: {str(e)}"
+        pdf_files = sorted(pdf_dir.glob("*.pdf"))
+
+        # Parse PDFs in a process pool - parsing is regex/CPU bound, so
+        # separate processes sidestep the GIL and use every core
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parse_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, _parse_pdf_worker, str(file_path))
+                    for file_path in pdf_files
+                ),
+                return_exceptions=True
+            )
+
+        # Collect successful parses; failures are recorded per file
+        parsed = []
+        for file_path, document_data in zip(pdf_files, parse_results):
+            if isinstance(document_data, Exception):
+                error_msg = f"Error processing {file_path.name}: {str(document_data)}"
                 print(f"❌ {error_msg}")
                 self.errors.append(error_msg)
-        
+            else:
+                parsed.append((file_path, document_data))
+
+        # Store the whole batch in a single transaction, off the event
+        # loop so database I/O does not block other coroutines
+        try:
+            document_ids = await asyncio.to_thread(self.store_documents_batch, parsed)
+        except Exception as e:
+            error_msg = f"Error storing documents: {str(e)}"
+            print(f"❌ {error_msg}")
+            self.errors.append(error_msg)
+            return self.processed_documents
+
+        for (file_path, document_data), document_id in zip(parsed, document_ids):
+            self.processed_documents.append({
+                "file_path": str(file_path),
+                "document_type": document_data.document_type.value,
+                "document_number": document_data.document_number,
+                "vendor": document_data.vendor,
+                "confidence": document_data.extraction_confidence,
+                "database_id": document_id
+            })
+            print(f"✅ Successfully processed and stored: {file_path.name}")
+
         return self.processed_documents
     
-    async def store_document_data(self, document_data, file_path: str) -> Dict[str, Any]:
-        """Store parsed document data in the database and return document info"""
+    def store_documents_batch(self, parsed: List[tuple]) -> List[int]:
+        """Store all parsed documents in one transaction with bulk inserts
+
+        Returns the database IDs of the stored documents, in input order.
+        """
+        if not parsed:
+            return []
+
         try:
             with DatabaseSession(self.db_path) as session:
-                # Get or create vendor
-                vendor = self.get_or_create_vendor(session, document_data.vendor)
-                
-                # Determine the appropriate date for this document type
-                document_date = document_data.date
-                
-                # For receipts, use date_received if date is None
-                from pdf_parser.parser import DocumentType as ParserDocumentType
-                if (document_data.document_type == ParserDocumentType.RECEIPT and 
-                    document_date is None and 
-                    hasattr(document_data, 'date_received') and 
-                    document_data.date_received is not None):
-                    document_date = document_data.date_received
-                
-                # Create main business document record
-                business_doc = BusinessDocument(
-                    document_type=self.convert_document_type(document_data.document_type),
-                    document_number=document_data.document_number,
-                    vendor=document_data.vendor,
-                    date=document_date,
-                    pdf_filename=Path(file_path).name,
-                    pdf_path=file_path,
-                    pdf_file_size=Path(file_path).stat().st_size,
-                    pdf_pages=1,  # TODO: Get actual page count
-                    parsing_confidence=Decimal(str(document_data.extraction_confidence)),
-                    extraction_method=document_data.extraction_method,
-                    raw_text=document_data.raw_text,
-                    extraction_metadata=document_data.metadata,
-                    status="extracted"
-                )
-                
-                session.add(business_doc)
-                session.flush()  # Get the ID without committing
-                
-                # Create document-specific records
-                from pdf_parser.parser import DocumentType as ParserDocumentType
-                if document_data.document_type == ParserDocumentType.PURCHASE_ORDER:
-                    await self.store_purchase_order(session, document_data, business_doc.id)
-                elif document_data.document_type == ParserDocumentType.INVOICE:
-                    await self.store_invoice(session, document_data, business_doc.id)
-                elif document_data.document_type == ParserDocumentType.RECEIPT:
-                    await self.store_receipt(session, document_data, business_doc.id)
-                
-                # Store line items if present
-                if document_data.line_items:
-                    await self.store_line_items(session, document_data.line_items, business_doc.id)
-                
-                # Update vendor statistics
-                self.update_vendor_statistics(session, vendor, document_data)
-                
-                session.commit()
-                
-                # Access ID before session closes to avoid detachment issues
-                document_id = business_doc.id
-                
-                # Create a simple dict with the data we need instead of returning the SQLAlchemy object
-                return {
-                    'id': document_id,
-                    'document_type': business_doc.document_type,
-                    'document_number': business_doc.document_number
+                # Resolve all vendors for the batch up front: one SELECT,
+                # one bulk INSERT for the missing names
+                vendor_names = {
+                    document_data.vendor or "Unknown Vendor"
+                    for _, document_data in parsed
                 }
-                
+                vendors = self.resolve_vendors(session, vendor_names)
+
+                # Bulk insert all business documents and capture their IDs
+                # in one round trip
+                doc_rows = [
+                    self.build_document_row(document_data, file_path)
+                    for file_path, document_data in parsed
+                ]
+                document_ids = session.execute(
+                    insert(BusinessDocument).returning(
+                        BusinessDocument.id, sort_by_parameter_order=True
+                    ),
+                    doc_rows
+                ).scalars().all()
+
+                # Build document-specific and line item rows against the new
+                # IDs, dispatching on document type instead of branch chains
+                po_rows, invoice_rows, receipt_rows, line_item_rows = [], [], [], []
+                row_builders = {
+                    ParserDocumentType.PURCHASE_ORDER: (self.build_purchase_order_row, po_rows),
+                    ParserDocumentType.INVOICE: (self.build_invoice_row, invoice_rows),
+                    ParserDocumentType.RECEIPT: (self.build_receipt_row, receipt_rows)
+                }
+                vendor_stats = {}
+                for (_, document_data), document_id in zip(parsed, document_ids):
+                    dispatch = row_builders.get(document_data.document_type)
+                    if dispatch:
+                        build_row, rows = dispatch
+                        rows.append(build_row(document_data, document_id))
+
+                    if document_data.line_items:
+                        line_item_rows.extend(
+                            self.build_line_item_rows(document_data.line_items, document_id)
+                        )
+
+                    # Accumulate vendor statistic deltas instead of mutating rows
+                    vendor_name = document_data.vendor or "Unknown Vendor"
+                    self.accumulate_vendor_statistics(
+                        vendor_stats, vendors[vendor_name].id, document_data
+                    )
+
+                # One bulk insert per table instead of one transaction per PDF
+                if po_rows:
+                    session.execute(insert(PurchaseOrder), po_rows)
+                if invoice_rows:
+                    session.execute(insert(Invoice), invoice_rows)
+                if receipt_rows:
+                    session.execute(insert(Receipt), receipt_rows)
+                if line_item_rows:
+                    session.execute(insert(DocumentLineItem), line_item_rows)
+
+                # Apply all vendor deltas in one executemany UPDATE
+                self.apply_vendor_statistics(session, vendor_stats)
+
+                # Single commit for the whole batch
+                session.commit()
+
+                return list(document_ids)
+
         except Exception as e:
             print(f"❌ Error storing document data: {e}")
             raise
+
+    def build_document_row(self, document_data, file_path: Path) -> Dict[str, Any]:
+        """Build the BusinessDocument insert row for a parsed document"""
+        # Determine the appropriate date for this document type
+        document_date = document_data.date
+
+        # For receipts, use date_received if date is None
+        if (document_data.document_type == ParserDocumentType.RECEIPT and
+            document_date is None and
+            hasattr(document_data, 'date_received') and
+            document_data.date_received is not None):
+            document_date = document_data.date_received
+
+        # One stat() syscall per document
+        stat_result = file_path.stat()
+
+        return {
+            "document_type": self.convert_document_type(document_data.document_type),
+            "document_number": document_data.document_number,
+            "vendor": document_data.vendor,
+            "date": document_date,
+            "pdf_filename": file_path.name,
+            "pdf_path": str(file_path),
+            "pdf_file_size": stat_result.st_size,
+            "pdf_pages": 1,  # TODO: Get actual page count
+            "parsing_confidence": _to_decimal(document_data.extraction_confidence),
+            "extraction_method": document_data.extraction_method,
+            "raw_text": document_data.raw_text,
+            "extraction_metadata": document_data.metadata,
+            "status": "extracted",
+            "line_items_count": len(document_data.line_items) if document_data.line_items else 0
+        }
     
-    def get_or_create_vendor(self, session, vendor_name: str) -> Vendor:
-        """Get or create vendor record"""
-        if not vendor_name:
-            vendor_name = "Unknown Vendor"
-        
-        # Check if vendor exists
-        vendor = session.query(Vendor).filter_by(name=vendor_name).first()
-        
-        if not vendor:
-            # Create new vendor
-            vendor = Vendor(
-                name=vendor_name,
-                normalized_name=normalize_vendor_name(vendor_name)
+    def resolve_vendors(self, session, vendor_names) -> Dict[str, Vendor]:
+        """Build a name -> Vendor map for the batch, creating missing vendors
+
+        Issues one SELECT for the whole name set and one bulk INSERT for
+        the names that do not exist yet, instead of a SELECT (and maybe
+        INSERT + flush) per document.
+        """
+        vendors = {
+            vendor.name: vendor
+            for vendor in session.query(Vendor).filter(Vendor.name.in_(vendor_names)).all()
+        }
+
+        missing = sorted(vendor_names - vendors.keys())
+        if missing:
+            session.execute(
+                self._vendor_insert_stmt(session),
+                [
+                    {"name": name, "normalized_name": normalize_vendor_name(name)}
+                    for name in missing
+                ]
             )
-            session.add(vendor)
-            session.flush()
-        
-        return vendor
-    
-    async def store_purchase_order(self, session, po_data: PurchaseOrderData, document_id: int):
-        """Store purchase order specific data"""
-        po = PurchaseOrder(
-            document_id=document_id,
-            po_number=po_data.po_number,
-            total_amount=po_data.total_amount
-        )
-        session.add(po)
-    
-    async def store_invoice(self, session, invoice_data: InvoiceData, document_id: int):
-        """Store invoice specific data"""
-        invoice = Invoice(
-            document_id=document_id,
-            invoice_number=invoice_data.invoice_number,
-            reference_po=invoice_data.reference_po,
-            total_amount=invoice_data.total_amount,
-            item_description=invoice_data.item,
-            quantity=invoice_data.quantity,
-            unit_price=invoice_data.unit_price
-        )
-        session.add(invoice)
-    
-    async def store_receipt(self, session, receipt_data: ReceiptData, document_id: int):
-        """Store receipt specific data"""
-        receipt = Receipt(
-            document_id=document_id,
-            receipt_id=receipt_data.receipt_id,
-            reference_po=receipt_data.reference_po,
-            date_received=receipt_data.date_received,
-            item_description=receipt_data.item,
-            quantity_received=receipt_data.quantity_received
-        )
-        session.add(receipt)
+            # Re-select to pick up the newly assigned IDs
+            for vendor in session.query(Vendor).filter(Vendor.name.in_(missing)).all():
+                vendors[vendor.name] = vendor
+
+        return vendors
+
+    @staticmethod
+    def _vendor_insert_stmt(session):
+        """Vendor INSERT that ignores conflicts on name where supported"""
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+            return pg_insert(Vendor).on_conflict_do_nothing(index_elements=["name"])
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+            return sqlite_insert(Vendor).on_conflict_do_nothing(index_elements=["name"])
+        return insert(Vendor)
     
-    async def store_line_items(self, session, line_items: List[Dict[str, Any]], document_id: int):
-        """Store line items for a document"""
-        for i, item_data in enumerate(line_items):
-            line_item = DocumentLineItem(
-                document_id=document_id,
-                item_description=item_data.get('item_description', ''),
-                quantity=item_data.get('quantity', 0),
-                unit_price=Decimal(str(item_data.get('unit_price', 0))),
-                line_total=Decimal(str(item_data.get('line_total', 0))),
-                line_number=i + 1,
-                extraction_confidence=Decimal(str(item_data.get('extraction_confidence', 0.0)))
-            )
-            session.add(line_item)
+    def build_purchase_order_row(self, po_data: PurchaseOrderData, document_id: int) -> Dict[str, Any]:
+        """Build the PurchaseOrder insert row"""
+        return {
+            "document_id": document_id,
+            "po_number": po_data.po_number,
+            "total_amount": po_data.total_amount
+        }
+
+    def build_invoice_row(self, invoice_data: InvoiceData, document_id: int) -> Dict[str, Any]:
+        """Build the Invoice insert row"""
+        return {
+            "document_id": document_id,
+            "invoice_number": invoice_data.invoice_number,
+            "reference_po": invoice_data.reference_po,
+            "total_amount": invoice_data.total_amount,
+            "item_description": invoice_data.item,
+            "quantity": invoice_data.quantity,
+            "unit_price": invoice_data.unit_price
+        }
+
+    def build_receipt_row(self, receipt_data: ReceiptData, document_id: int) -> Dict[str, Any]:
+        """Build the Receipt insert row"""
+        return {
+            "document_id": document_id,
+            "receipt_id": receipt_data.receipt_id,
+            "reference_po": receipt_data.reference_po,
+            "date_received": receipt_data.date_received,
+            "item_description": receipt_data.item,
+            "quantity_received": receipt_data.quantity_received
+        }
+
+    def build_line_item_rows(self, line_items: List[Dict[str, Any]], document_id: int) -> List[Dict[str, Any]]:
+        """Build DocumentLineItem insert rows for a document"""
+        return [
+            {
+                "document_id": document_id,
+                "item_description": item_data.get('item_description', ''),
+                "quantity": item_data.get('quantity', 0),
+                "unit_price": _to_decimal(item_data.get('unit_price', 0)),
+                "line_total": _to_decimal(item_data.get('line_total', 0)),
+                "line_number": i + 1,
+                "extraction_confidence": _to_decimal(item_data.get('extraction_confidence', 0.0))
+            }
+            for i, item_data in enumerate(line_items)
+        ]
     
-    def update_vendor_statistics(self, session, vendor: Vendor, document_data):
-        """Update vendor statistics"""
-        from pdf_parser.parser import DocumentType as ParserDocumentType
-        
-        vendor.total_documents += 1
-        
+    def accumulate_vendor_statistics(self, vendor_stats: Dict[int, Dict[str, Any]], vendor_id: int, document_data):
+        """Accumulate statistic deltas for one document into vendor_stats"""
+        stats = vendor_stats.setdefault(vendor_id, {
+            "docs": 0, "orders": 0, "invoices": 0, "receipts": 0, "amount": Decimal(0)
+        })
+        stats["docs"] += 1
+
         if document_data.document_type == ParserDocumentType.PURCHASE_ORDER:
-            vendor.total_orders += 1
+            stats["orders"] += 1
         elif document_data.document_type == ParserDocumentType.INVOICE:
-            vendor.total_invoices += 1
+            stats["invoices"] += 1
         elif document_data.document_type == ParserDocumentType.RECEIPT:
-            vendor.total_receipts += 1
-        
+            stats["receipts"] += 1
+
         # Update total amount if available
         if hasattr(document_data, 'total_amount') and document_data.total_amount:
-            vendor.total_amount += document_data.total_amount
+            stats["amount"] += document_data.total_amount
+
+    def apply_vendor_statistics(self, session, vendor_stats: Dict[int, Dict[str, Any]]):
+        """Apply all accumulated vendor deltas in a single UPDATE statement"""
+        if not vendor_stats:
+            return
+
+        stmt = update(Vendor).where(Vendor.id == bindparam("vendor_id")).values(
+            total_documents=Vendor.total_documents + bindparam("docs"),
+            total_orders=Vendor.total_orders + bindparam("orders"),
+            total_invoices=Vendor.total_invoices + bindparam("invoices"),
+            total_receipts=Vendor.total_receipts + bindparam("receipts"),
+            total_amount=Vendor.total_amount + bindparam("amount")
+        )
+        session.connection().execute(
+            stmt,
+            [
+                {"vendor_id": vendor_id, **stats}
+                for vendor_id, stats in vendor_stats.items()
+            ]
+        )
     
     async def generate_report(self):
         """Generate processing report"""
@@ -341,13 +462,16 @@ class PDFProcessingWorkflow:
         
         try:
             with DatabaseSession(self.db_path) as session:
-                # Count records by table
-                business_docs = session.query(BusinessDocument).count()
-                pos = session.query(PurchaseOrder).count()
-                invoices = session.query(Invoice).count()
-                receipts = session.query(Receipt).count()
-                line_items = session.query(DocumentLineItem).count()
-                vendors = session.query(Vendor).count()
+                # Count all tables in one round trip
+                business_docs, pos, invoices, receipts, line_items, vendors = session.execute(text(
+                    "SELECT "
+                    "(SELECT count(*) FROM business_documents), "
+                    "(SELECT count(*) FROM purchase_orders), "
+                    "(SELECT count(*) FROM invoices), "
+                    "(SELECT count(*) FROM receipts), "
+                    "(SELECT count(*) FROM document_line_items), "
+                    "(SELECT count(*) FROM vendors)"
+                )).one()
                 
                 print(f"Business Documents: {business_docs}")
                 print(f"Purchase Orders: {pos}")
@@ -9,17 +9,39 @@ import sys
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from sqlalchemy import select
+from sqlalchemy.orm import configure_mappers, selectinload
+
 from database.connection import DatabaseSession
 from database.models import BusinessDocument, PurchaseOrder, Invoice, Receipt, DocumentLineItem, Vendor
 
+# Resolve all relationship configuration up front so the first query
+# doesn't pay for it
+configure_mappers()
+
 def display_database_contents():
-    """Display all database contents in a readable format"""
-    
+    """Display all database contents in a readable format
+
+    Streams documents with their subtype and line item relations batched
+    in via selectinload, so memory stays bounded and no per-document
+    follow-up queries are issued.
+    """
+
     with DatabaseSession() as session:
         print("🏢 BUSINESS DOCUMENTS")
         print("=" * 50)
-        
-        docs = session.query(BusinessDocument).all()
+
+        docs = session.execute(
+            select(BusinessDocument)
+            .options(
+                selectinload(BusinessDocument.purchase_order),
+                selectinload(BusinessDocument.invoice),
+                selectinload(BusinessDocument.receipt),
+                selectinload(BusinessDocument.line_items),
+            )
+            .execution_options(yield_per=1000)
+        ).scalars()
+
         for doc in docs:
             print(f"ID: {doc.id}")
             print(f"Type: {doc.document_type.value}")
@@ -29,66 +51,44 @@ def display_database_contents():
             print(f"File: {doc.pdf_filename}")
             print(f"Confidence: {doc.parsing_confidence}")
             print(f"Status: {doc.status}")
+
+            if doc.purchase_order:
+                po = doc.purchase_order
+                print(f"  💰 PO Number: {po.po_number}")
+                print(f"     Total: ${po.total_amount}")
+
+            if doc.invoice:
+                inv = doc.invoice
+                print(f"  📋 Invoice Number: {inv.invoice_number}")
+                print(f"     Reference PO: {inv.reference_po}")
+                print(f"     Total: ${inv.total_amount}")
+                print(f"     Item: {inv.item_description}")
+                print(f"     Quantity: {inv.quantity}")
+                print(f"     Unit Price: ${inv.unit_price}")
+
+            if doc.receipt:
+                rcpt = doc.receipt
+                print(f"  🧾 Receipt ID: {rcpt.receipt_id}")
+                print(f"     Reference PO: {rcpt.reference_po}")
+                print(f"     Date Received: {rcpt.date_received}")
+                print(f"     Item: {rcpt.item_description}")
+                print(f"     Quantity Received: {rcpt.quantity_received}")
+
+            for item in doc.line_items:
+                print(f"  📝 Item: {item.item_description}")
+                print(f"     Quantity: {item.quantity}")
+                print(f"     Unit Price: ${item.unit_price}")
+                print(f"     Line Total: ${item.line_total}")
+                print(f"     Confidence: {item.extraction_confidence}")
+
             print("-" * 30)
-        
-        print("\n💰 PURCHASE ORDERS")
-        print("=" * 50)
-        
-        pos = session.query(PurchaseOrder).all()
-        for po in pos:
-            print(f"ID: {po.id}")
-            print(f"Document ID: {po.document_id}")
-            print(f"PO Number: {po.po_number}")
-            print(f"Total: ${po.total_amount}")
-            print("-" * 30)
-        
-        print("\n📋 INVOICES")
-        print("=" * 50)
-        
-        invoices = session.query(Invoice).all()
-        for inv in invoices:
-            print(f"ID: {inv.id}")
-            print(f"Document ID: {inv.document_id}")
-            print(f"Invoice Number: {inv.invoice_number}")
-            print(f"Reference PO: {inv.reference_po}")
-            print(f"Total: ${inv.total_amount}")
-            print(f"Item: {inv.item_description}")
-            print(f"Quantity: {inv.quantity}")
-            print(f"Unit Price: ${inv.unit_price}")
-            print("-" * 30)
-        
-        print("\n🧾 RECEIPTS")
-        print("=" * 50)
-        
-        receipts = session.query(Receipt).all()
-        for rcpt in receipts:
-            print(f"ID: {rcpt.id}")
-            print(f"Document ID: {rcpt.document_id}")
-            print(f"Receipt ID: {rcpt.receipt_id}")
-            print(f"Reference PO: {rcpt.reference_po}")
-            print(f"Date Received: {rcpt.date_received}")
-            print(f"Item: {rcpt.item_description}")
-            print(f"Quantity Received: {rcpt.quantity_received}")
-            print("-" * 30)
-        
-        print("\n📝 LINE ITEMS")
-        print("=" * 50)
-        
-        items = session.query(DocumentLineItem).all()
-        for item in items:
-            print(f"ID: {item.id}")
-            print(f"Document ID: {item.document_id}")
-            print(f"Item: {item.item_description}")
-            print(f"Quantity: {item.quantity}")
-            print(f"Unit Price: ${item.unit_price}")
-            print(f"Line Total: ${item.line_total}")
-            print(f"Confidence: {item.extraction_confidence}")
-            print("-" * 30)
-        
+
         print("\n👥 VENDORS")
         print("=" * 50)
-        
-        vendors = session.query(Vendor).all()
+
+        vendors = session.execute(
+            select(Vendor).execution_options(yield_per=1000)
+        ).scalars()
         for vendor in vendors:
             print(f"ID: {vendor.id}")
             print(f"Name: {vendor.name}")
@@ -101,4 +101,4 @@ def display_database_contents():
             print("-" * 30)
 
 if __name__ == "__main__":
-    display_database_contents() 
\ No newline at end of file
+    display_database_contents()
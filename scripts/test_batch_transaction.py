@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+"""
+Test script to verify batch document storage is atomic
+
+A batch that fails partway through (here: a duplicate PO number hitting
+the purchase_orders UNIQUE constraint) must leave zero new
+business_documents rows behind, not orphaned documents without subtype
+rows or line items.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def count_documents(db_path: str) -> int:
+    import sqlite3
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM business_documents").fetchone()[0]
+
+
+def test_mid_batch_failure_rolls_back():
+    """A failing batch must not commit any of its document rows"""
+    from database.setup import initialize_database
+    from database.connection import reset_connection
+    from pdf_parser.parser import BusinessDocumentPDFParser
+
+    sys.path.insert(0, os.path.dirname(__file__))
+    from pdf_to_database_workflow import PDFProcessingWorkflow
+
+    sample_dir = Path(__file__).parent.parent / "sample_data"
+    po_path = sample_dir / "PO-1001_Titan_Steel_Co.pdf"
+    inv_path = sample_dir / "INV-8891_Titan_Steel_Co.pdf"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "test_batch.db")
+        reset_connection()
+        initialize_database(db_path)
+
+        parser = BusinessDocumentPDFParser()
+        po_data = parser.parse_document(str(po_path))
+        inv_data = parser.parse_document(str(inv_path))
+
+        workflow = PDFProcessingWorkflow(db_path)
+
+        # First batch stores the PO cleanly
+        workflow.store_documents_batch([(po_path, po_data)])
+        baseline = count_documents(db_path)
+        if baseline != 1:
+            print(f"❌ Setup batch stored {baseline} documents, expected 1", file=sys.stderr)
+            return False
+
+        # Second batch fails mid-way: the invoice row would succeed, but
+        # the duplicate PO number violates purchase_orders.po_number
+        try:
+            workflow.store_documents_batch([(inv_path, inv_data), (po_path, po_data)])
+            print("❌ Duplicate batch unexpectedly succeeded", file=sys.stderr)
+            return False
+        except Exception:
+            pass
+
+        after = count_documents(db_path)
+        if after != baseline:
+            print(f"❌ Failed batch leaked {after - baseline} document rows", file=sys.stderr)
+            return False
+
+        print("✅ Mid-batch failure left zero new business_documents rows", file=sys.stderr)
+        return True
+
+
+if __name__ == "__main__":
+    print("Testing batch storage atomicity...", file=sys.stderr)
+    success = test_mid_batch_failure_rolls_back()
+    sys.exit(0 if success else 1)
@@ -9,128 +9,166 @@ Usage:
     python scripts/test_cloud_connection.py
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
 
-# Add src to path for imports
+# Add src to path for imports (skip if already present so repeated
+# imports don't grow sys.path and re-scan the directory)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / 'src'))
+_src_path = str(project_root / 'src')
+if _src_path not in sys.path:
+    sys.path.insert(0, _src_path)
+
+from sqlalchemy import delete, insert, inspect, text
 
 from database.connection import get_engine, DatabaseSession
 from database.models import Base, BusinessDocument, DocumentType
 from datetime import datetime
 
+# Lazy %-style logging: arguments are only formatted when the level is
+# enabled, unlike eager f-string prints
+log = logging.getLogger(__name__)
+
+# Resolve the engine once at module load; connection.py caches it as a
+# singleton, so every test shares one pool instead of paying connection
+# setup (TCP+TLS on cloud Postgres) per test
+engine = get_engine()
+
 
 def test_connection():
     """Test basic database connectivity"""
-    print("🔗 Testing database connection...")
-    
+    log.info("🔗 Testing database connection...")
+
     try:
-        engine = get_engine()
-        with engine.connect() as conn:
-            from sqlalchemy import text
-            result = conn.execute(text("SELECT 1 as test"))
-            print(f"✅ Connection successful: {result.fetchone()}")
+        # AUTOCOMMIT skips the implicit BEGIN/ROLLBACK pair a plain
+        # connect() would issue around a read-only ping
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # Single-scalar fetch: no Row wrapping for a trivial ping
+            result = conn.scalar(text("SELECT 1"))
+            log.info("✅ Connection successful: %s", result)
         return True
     except Exception as e:
-        print(f"❌ Connection failed: {e}")
+        log.error("❌ Connection failed: %s", e)
         return False
 
 
 def test_schema_creation():
     """Test schema creation"""
-    print("📋 Testing schema creation...")
-    
+    log.info("📋 Testing schema creation...")
+
     try:
-        engine = get_engine()
-        Base.metadata.create_all(engine)
-        print("✅ Schema created successfully")
+        # One catalog query up front; create_all's per-table checkfirst
+        # probes (a round-trip each on cloud Postgres) only run when
+        # something is actually missing
+        existing_tables = set(inspect(engine).get_table_names())
+        missing_tables = set(Base.metadata.tables.keys()) - existing_tables
+
+        if missing_tables:
+            Base.metadata.create_all(engine)
+            log.info("✅ Schema created successfully")
+        else:
+            log.info("✅ Schema already present (%d tables)", len(existing_tables))
         return True
     except Exception as e:
-        print(f"❌ Schema creation failed: {e}")
+        log.error("❌ Schema creation failed: %s", e)
         return False
 
 
 def test_basic_operations():
     """Test basic CRUD operations"""
-    print("🔄 Testing basic database operations...")
-    
+    log.info("🔄 Testing basic database operations...")
+
     try:
         with DatabaseSession() as session:
-            # Create a test document
-            test_doc = BusinessDocument(
-                document_type=DocumentType.INVOICE,
-                document_number="TEST-001",
-                vendor="Test Vendor",
-                date=datetime.now(),
-                pdf_filename="test.pdf",
-                pdf_path="/tmp/test.pdf",
-                status="test"
-            )
-            
-            session.add(test_doc)
-            session.commit()
-            
-            # Read it back
-            found_doc = session.query(BusinessDocument).filter_by(document_number="TEST-001").first()
-            if found_doc:
-                print(f"✅ CRUD operations successful: Document {found_doc.id} created")
-                
-                # Clean up
-                session.delete(found_doc)
-                session.commit()
-                print("✅ Test data cleaned up")
-                return True
-            else:
-                print("❌ Could not read back test document")
+            # Create test documents as plain dicts so they go to the
+            # database as one executemany INSERT; RETURNING hands the
+            # primary keys back without a read-back SELECT
+            rows = [
+                {
+                    "document_type": DocumentType.INVOICE,
+                    "document_number": f"TEST-{i:03d}",
+                    "vendor": "Test Vendor",
+                    "date": datetime.now(),
+                    "pdf_filename": f"test_{i}.pdf",
+                    "pdf_path": f"/tmp/test_{i}.pdf",
+                    "status": "test"
+                }
+                for i in range(1, 4)
+            ]
+
+            doc_ids = session.execute(
+                insert(BusinessDocument).returning(BusinessDocument.id),
+                rows
+            ).scalars().all()
+
+            if len(doc_ids) != len(rows):
+                log.error("❌ Could not read back test documents")
                 return False
-                
+
+            log.info("✅ CRUD operations successful: Documents %s created", doc_ids)
+
+            # Clean up with one statement in the same transaction; the
+            # context manager issues the single commit on exit
+            session.execute(
+                delete(BusinessDocument).where(
+                    BusinessDocument.document_number.like('TEST-%')
+                )
+            )
+            log.info("✅ Test data cleaned up")
+            return True
+
+
     except Exception as e:
-        print(f"❌ CRUD operations failed: {e}")
+        log.error("❌ CRUD operations failed: %s", e)
         return False
 
 
 def main():
     """Run all tests"""
-    print("🧪 Cloud Database Test Suite")
-    print("=" * 40)
-    
+    # Message-only format on stdout keeps the output identical to the
+    # old print statements
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    log.info("🧪 Cloud Database Test Suite")
+    log.info("=" * 40)
+
     # Check environment
     database_url = os.getenv('DATABASE_URL')
     if not database_url:
-        print("❌ DATABASE_URL not set")
-        print("   Set it with: export DATABASE_URL='your_database_url'")
+        log.error("❌ DATABASE_URL not set")
+        log.error("   Set it with: export DATABASE_URL='your_database_url'")
         return False
-    
-    print(f"🎯 Testing database: {database_url[:50]}...")
-    print()
-    
+
+    log.info("🎯 Testing database: %s...", database_url[:50])
+    log.info("")
+
     # Run tests
     tests = [
         ("Connection", test_connection),
         ("Schema Creation", test_schema_creation),
         ("Basic Operations", test_basic_operations)
     ]
-    
+
     passed = 0
     for name, test_func in tests:
         if test_func():
             passed += 1
-        print()
-    
+        log.info("")
+
     # Summary
-    print("📊 Test Results:")
-    print(f"   Passed: {passed}/{len(tests)}")
-    
+    log.info("📊 Test Results:")
+    log.info("   Passed: %d/%d", passed, len(tests))
+
     if passed == len(tests):
-        print("🎉 All tests passed! Your cloud database is ready to use.")
+        log.info("🎉 All tests passed! Your cloud database is ready to use.")
         return True
     else:
-        print("❌ Some tests failed. Please check your configuration.")
+        log.error("❌ Some tests failed. Please check your configuration.")
         return False
 
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -14,6 +14,7 @@ Centralized configuration using environment variables with sensible defaults.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -32,27 +33,24 @@ load_dotenv()
 #     url: str
 #     max_size: int = 50 * 1024 * 1024  # 50MB
 
-# Get the project root directory (where this file's parent's parent is)
-# Handle case where this file might be imported from different locations
-# AUDIT: This logic is overly complex and fragile - use a simpler approach
-CONFIG_FILE_PATH = Path(__file__).resolve()
-if CONFIG_FILE_PATH.name == 'config.py':
-    PROJECT_ROOT = CONFIG_FILE_PATH.parent.parent.resolve()
-else:
-    # Fallback: find the project root by looking for known files
-    # BUG POTENTIAL: This could fail silently or find wrong directory
-    current = CONFIG_FILE_PATH.parent
-    while current.parent != current:
-        if (current / 'requirements.txt').exists() and (current / 'src').exists():
-            PROJECT_ROOT = current
-            break
-        current = current.parent
-    else:
-        # IMPROVEMENT: Should raise explicit error instead of defaulting to cwd
-        PROJECT_ROOT = Path.cwd()
-
-# IMPROVEMENT: Replace complex logic with simple approach:
-# PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+# Get the project root directory (where this file's parent's parent is).
+# __file__ always points at this file, so no filesystem search is needed;
+# the old fallback loop stat()ed every ancestor directory on import.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Heroku/Supabase-style URLs use the legacy scheme SQLAlchemy dropped
+_POSTGRES_LEGACY_PREFIX = 'postgres://'
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process; repeat calls skip the syscall"""
+    try:
+        path.mkdir(exist_ok=True)
+    except PermissionError as e:
+        # TODO: Add proper error handling and logging
+        raise RuntimeError(f"Cannot create directory {path}: {e}")
+    return path
 
 def get_database_path() -> str:
     """
@@ -76,8 +74,8 @@ def get_database_path() -> str:
     database_url = os.getenv('DATABASE_URL')
     if database_url:
         # Handle Supabase/Heroku format: postgres://... -> postgresql://...
-        if database_url.startswith('postgres://'):
-            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+        if database_url.startswith(_POSTGRES_LEGACY_PREFIX):
+            database_url = database_url.replace(_POSTGRES_LEGACY_PREFIX, 'postgresql://', 1)
         return database_url
     
     # Check environment variable for local SQLite path
@@ -89,21 +87,20 @@ def get_database_path() -> str:
         return f"sqlite:///{os.path.abspath(env_path)}"
     
     # Default: use data directory in project root
-    data_dir = PROJECT_ROOT / 'data'
-    # IMPROVEMENT: Handle permission errors explicitly
-    try:
-        data_dir.mkdir(exist_ok=True)  # Create data directory if it doesn't exist
-    except PermissionError as e:
-        # TODO: Add proper error handling and logging
-        raise RuntimeError(f"Cannot create data directory: {e}")
-    
+    data_dir = _ensure_dir(PROJECT_ROOT / 'data')
+
     sqlite_path = str(data_dir / 'business_documents.db')
     return f"sqlite:///{sqlite_path}"
 
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
     """
     Get the database URL for SQLAlchemy.
-    
+
+    Cached for the life of the process: every test script triggers this
+    at import time through DATABASE_URL below, and the environment does
+    not change underneath a running process.
+
     Returns:
         Complete database URL string
     """
@@ -121,13 +118,7 @@ def get_logs_path() -> str:
     
     # AUDIT: Same issues as get_database_path - no error handling
     """
-    logs_dir = PROJECT_ROOT / 'logs'
-    # IMPROVEMENT: Add proper error handling
-    try:
-        logs_dir.mkdir(exist_ok=True)
-    except PermissionError as e:
-        raise RuntimeError(f"Cannot create logs directory: {e}")
-    return str(logs_dir)
+    return str(_ensure_dir(PROJECT_ROOT / 'logs'))
 
 # Database configuration
 # IMPROVEMENT: Use proper configuration class instead of global variables
@@ -5,9 +5,9 @@ Provides database connectivity using SQLAlchemy with SQLite.
 """
 
 import os
-from sqlalchemy import create_engine, Engine, text
+import threading
+from sqlalchemy import create_engine, event, Engine, text
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 from typing import Optional, Dict, Any
 
 # Import centralized configuration
@@ -21,10 +21,30 @@ except ImportError:
     from config import DATABASE_URL
 
 
+# orjson serializes the JSON columns (extraction_metadata, contact_info)
+# several times faster than stdlib json and handles datetimes natively;
+# fall back silently when it is not installed
+try:
+    import orjson
+
+    def _json_serializer(value) -> str:
+        return orjson.dumps(value).decode()
+
+    _json_deserializer = orjson.loads
+except ImportError:
+    import json
+
+    _json_serializer = json.dumps
+    _json_deserializer = json.loads
+
+
 # Global variables for database connection
 _engine: Optional[Engine] = None
 _session_factory: Optional[sessionmaker] = None
 
+# Guards first-call races so concurrent callers never build two pools
+_engine_lock = threading.Lock()
+
 
 def get_database_url(db_path: Optional[str] = None) -> str:
     """Get database URL for SQLAlchemy"""
@@ -37,33 +57,83 @@ def get_database_url(db_path: Optional[str] = None) -> str:
     return f"sqlite:///{db_path}"
 
 
+def _begin_sqlite_transaction(conn):
+    """Emit BEGIN so SQLAlchemy transactions are real on pysqlite
+
+    The engine leaves pysqlite in driver-level autocommit
+    (isolation_level=None) so the connect-time PRAGMAs run outside any
+    transaction; without this listener every statement would commit the
+    moment it executes and Session.rollback() could never undo a
+    partially stored batch.
+    """
+    conn.exec_driver_sql("BEGIN")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs on each new SQLite connection
+
+    WAL + synchronous=NORMAL cut the per-commit fsync cost that dominates
+    SQLite write throughput; the cache/mmap settings speed up large scans.
+    """
+    cursor = dbapi_connection.cursor()
+    # foreign_keys first so constraints are enforced before any writes
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+    cursor.execute("PRAGMA busy_timeout=5000")  # Wait out writer contention
+    cursor.close()
+
+
 def get_engine(db_path: Optional[str] = None, echo: bool = False) -> Engine:
     """Get SQLAlchemy engine for database operations"""
     global _engine
-    
-    if _engine is None:
+
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is not None:
+            return _engine
         database_url = get_database_url(db_path)
         
         # Database-specific configuration
         if database_url.startswith('sqlite'):
-            # SQLite-specific configuration
+            # SQLite-specific configuration. The default QueuePool hands
+            # each thread its own connection; the old StaticPool shared a
+            # single handle, serializing concurrent parsers even though
+            # WAL supports concurrent readers alongside one writer.
             _engine = create_engine(
                 database_url,
                 echo=echo,
-                poolclass=StaticPool,
+                pool_size=5,
+                max_overflow=5,
+                json_serializer=_json_serializer,
+                json_deserializer=_json_deserializer,
                 connect_args={
                     "check_same_thread": False,  # Allow multi-threading
                     "timeout": 30,  # Connection timeout
-                    "isolation_level": None  # Use autocommit mode
+                    "isolation_level": None  # Driver autocommit; see _begin_sqlite_transaction
                 }
             )
+            event.listen(_engine, "connect", _set_sqlite_pragmas)
+            event.listen(_engine, "begin", _begin_sqlite_transaction)
         else:
-            # PostgreSQL/other databases configuration
+            # PostgreSQL/other databases configuration. Explicit pool
+            # sizing so scripts and the MCP server share warm connections
+            # instead of paying a TCP+TLS handshake per operation; the
+            # shorter recycle stays under cloud-side idle timeouts.
             _engine = create_engine(
                 database_url,
                 echo=echo,
+                pool_size=5,
+                max_overflow=10,
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600,   # Recycle connections every hour
+                pool_recycle=1800,   # Recycle before idle timeouts kick in
+                json_serializer=_json_serializer,
+                json_deserializer=_json_deserializer,
                 connect_args={
                     "connect_timeout": 30,
                     "sslmode": "require" if "localhost" not in database_url else "prefer"
@@ -93,13 +163,18 @@ def get_session(db_path: Optional[str] = None) -> Session:
 def reset_connection():
     """Reset database connection (useful for testing)"""
     global _engine, _session_factory
-    
+
     if _engine:
         _engine.dispose()
         _engine = None
-    
+
     _session_factory = None
 
+    # Drop caches that assume the old database (import here to avoid a
+    # circular import at module load)
+    from . import queries
+    queries._vendor_id_cache.clear()
+
 
 class DatabaseManager:
     """Database manager for handling connections and sessions"""
@@ -5,8 +5,8 @@ Provides high-level query functions for searching and retrieving business docume
 """
 
 from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, text, func
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy import and_, or_, text, func, insert, select, update
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -17,6 +17,21 @@ from .models import (
 from .connection import get_session, DatabaseSession
 
 
+def _fts_available(session: Session) -> bool:
+    """Check whether the SQLite FTS5 index over business documents exists
+
+    The virtual table is created by initialize_database on SQLite;
+    PostgreSQL deployments and databases initialized before the index
+    existed fall back to the ILIKE scan.
+    """
+    if session.get_bind().dialect.name != 'sqlite':
+        return False
+    return session.execute(text(
+        "SELECT 1 FROM sqlite_master "
+        "WHERE type = 'table' AND name = 'business_documents_fts'"
+    )).first() is not None
+
+
 def search_business_documents(
     query: str,
     db_path: Optional[str] = None,
@@ -44,16 +59,27 @@ def search_business_documents(
         base_query = session.query(BusinessDocument)
         
         if include_line_items:
-            base_query = base_query.options(joinedload(BusinessDocument.line_items))
+            base_query = base_query.options(selectinload(BusinessDocument.line_items))
         
-        # Add search filters
+        # Add search filters: prefer the FTS5 inverted index (index
+        # lookup) over LIKE-scanning three columns of the whole table
         if query:
-            search_filter = or_(
-                BusinessDocument.document_number.ilike(f"%{query}%"),
-                BusinessDocument.vendor.ilike(f"%{query}%"),
-                BusinessDocument.pdf_filename.ilike(f"%{query}%")
-            )
-            base_query = base_query.filter(search_filter)
+            if _fts_available(session):
+                doc_ids = session.execute(
+                    text(
+                        "SELECT rowid FROM business_documents_fts "
+                        "WHERE business_documents_fts MATCH :match"
+                    ),
+                    {"match": '"%s"*' % query.replace('"', '""')}
+                ).scalars().all()
+                base_query = base_query.filter(BusinessDocument.id.in_(doc_ids))
+            else:
+                search_filter = or_(
+                    BusinessDocument.document_number.ilike(f"%{query}%"),
+                    BusinessDocument.vendor.ilike(f"%{query}%"),
+                    BusinessDocument.pdf_filename.ilike(f"%{query}%")
+                )
+                base_query = base_query.filter(search_filter)
         
         # Add document type filter
         if document_type:
@@ -96,38 +122,37 @@ def get_document_by_id(
         Document dictionary or None if not found
     """
     with DatabaseSession(db_path) as session:
-        query = session.query(BusinessDocument).filter(BusinessDocument.id == document_id)
-        
+        # Join the three one-to-one subtype rows into the main SELECT
+        # (each sits behind a unique document_id index) instead of
+        # issuing a follow-up query for the matching type
+        query = session.query(BusinessDocument).options(
+            joinedload(BusinessDocument.purchase_order),
+            joinedload(BusinessDocument.invoice),
+            joinedload(BusinessDocument.receipt)
+        ).filter(BusinessDocument.id == document_id)
+
         if include_line_items:
-            query = query.options(joinedload(BusinessDocument.line_items))
-        
+            query = query.options(selectinload(BusinessDocument.line_items))
+
         doc = query.first()
-        
+
         if not doc:
             return None
-        
+
         doc_dict = doc.to_dict()
-        
+
         # Add line items if requested
         if include_line_items and doc.line_items:
             doc_dict['line_items'] = [item.to_dict() for item in doc.line_items]
-        
+
         # Add document-specific details
-        if doc.document_type == DocumentType.PURCHASE_ORDER:
-            po = session.query(PurchaseOrder).filter(PurchaseOrder.document_id == document_id).first()
-            if po:
-                doc_dict['purchase_order'] = po.to_dict()
-        
-        elif doc.document_type == DocumentType.INVOICE:
-            invoice = session.query(Invoice).filter(Invoice.document_id == document_id).first()
-            if invoice:
-                doc_dict['invoice'] = invoice.to_dict()
-        
-        elif doc.document_type == DocumentType.RECEIPT:
-            receipt = session.query(Receipt).filter(Receipt.document_id == document_id).first()
-            if receipt:
-                doc_dict['receipt'] = receipt.to_dict()
-        
+        if doc.purchase_order:
+            doc_dict['purchase_order'] = doc.purchase_order.to_dict()
+        elif doc.invoice:
+            doc_dict['invoice'] = doc.invoice.to_dict()
+        elif doc.receipt:
+            doc_dict['receipt'] = doc.receipt.to_dict()
+
         return doc_dict
 
 
@@ -156,31 +181,39 @@ def list_business_documents(
         Dictionary with documents list and pagination info
     """
     with DatabaseSession(db_path) as session:
-        # Build query
-        query = session.query(BusinessDocument)
-        
+        # Build query; the filtered total rides along as a window
+        # function so the predicates run once instead of once for
+        # COUNT(*) and again for the page
+        query = session.query(BusinessDocument, func.count().over().label('total_count'))
+
         # Add filters
         if vendor:
             query = query.filter(BusinessDocument.vendor.ilike(f"%{vendor}%"))
-        
+
         if document_type:
             query = query.filter(BusinessDocument.document_type == document_type)
-        
+
         if date_from:
             query = query.filter(BusinessDocument.date >= date_from)
-        
+
         if date_to:
             query = query.filter(BusinessDocument.date <= date_to)
-        
-        # Get total count
-        total_count = query.count()
-        
+
         # Apply pagination
-        documents = query.order_by(
+        rows = query.order_by(
             BusinessDocument.date.desc(),
             BusinessDocument.created_at.desc()
         ).offset(offset).limit(limit).all()
-        
+
+        if rows:
+            total_count = rows[0][1]
+            documents = [row[0] for row in rows]
+        else:
+            documents = []
+            # A page past the end returns no rows, so the true total
+            # needs its own count
+            total_count = query.count() if offset else 0
+
         # Convert to dictionaries
         doc_list = [doc.to_dict() for doc in documents]
         
@@ -209,43 +242,46 @@ def get_database_summary(db_path: Optional[str] = None) -> Dict[str, Any]:
             BusinessDocument.document_type,
             func.count(BusinessDocument.id).label('count')
         ).group_by(BusinessDocument.document_type).all()
-        
-        # Total documents
-        total_docs = session.query(BusinessDocument).count()
-        
-        # Calculate total amounts
-        po_total = session.query(func.sum(PurchaseOrder.total_amount)).scalar() or 0
-        invoice_total = session.query(func.sum(Invoice.total_amount)).scalar() or 0
-        
-        # Get date range
-        date_range = session.query(
-            func.min(BusinessDocument.date).label('earliest'),
-            func.max(BusinessDocument.date).label('latest')
-        ).first()
-        
+
+        # All single-value aggregates travel as scalar subqueries in one
+        # SELECT, so the summary costs three round trips (this, the
+        # type counts above and the top-vendor rows below) instead of
+        # one per statistic
+        stats = session.execute(select(
+            select(func.count(BusinessDocument.id))
+            .scalar_subquery().label('total_docs'),
+            select(func.coalesce(func.sum(PurchaseOrder.total_amount), 0))
+            .scalar_subquery().label('po_total'),
+            select(func.coalesce(func.sum(Invoice.total_amount), 0))
+            .scalar_subquery().label('invoice_total'),
+            select(func.min(BusinessDocument.date))
+            .scalar_subquery().label('earliest'),
+            select(func.max(BusinessDocument.date))
+            .scalar_subquery().label('latest'),
+            select(func.count(Vendor.id))
+            .scalar_subquery().label('unique_vendors')
+        )).one()
+
         # Top vendors
         top_vendors = session.query(
             Vendor.name,
             Vendor.total_documents,
             Vendor.total_amount
         ).order_by(Vendor.total_documents.desc()).limit(10).all()
-        
-        # Unique vendors count
-        unique_vendors = session.query(Vendor).count()
-        
+
         # Build date_range - return None if no dates found, otherwise return dict with string values
         date_range_result = None
-        if date_range and date_range.earliest is not None and date_range.latest is not None:
+        if stats.earliest is not None and stats.latest is not None:
             date_range_result = {
-                "earliest": date_range.earliest.isoformat(),
-                "latest": date_range.latest.isoformat()
+                "earliest": stats.earliest.isoformat(),
+                "latest": stats.latest.isoformat()
             }
-        
+
         return {
-            "total_documents": total_docs,
+            "total_documents": stats.total_docs,
             "document_counts": {doc_type.value: count for doc_type, count in doc_counts},
-            "total_value": float(po_total + invoice_total),
-            "unique_vendors": unique_vendors,
+            "total_value": float(stats.po_total + stats.invoice_total),
+            "unique_vendors": stats.unique_vendors,
             "date_range": date_range_result,
             "top_vendors": [
                 {
@@ -276,7 +312,7 @@ def search_by_document_number(
     """
     with DatabaseSession(db_path) as session:
         query = session.query(BusinessDocument).options(
-            joinedload(BusinessDocument.line_items)
+            selectinload(BusinessDocument.line_items)
         )
         
         if exact_match:
@@ -332,23 +368,25 @@ def get_purchase_orders(
         List of purchase order dictionaries
     """
     with DatabaseSession(db_path) as session:
+        # contains_eager materializes the joined PurchaseOrder row into
+        # each document, so the loop below reads it off the object
+        # instead of issuing one SELECT per row
         pos = session.query(BusinessDocument).join(PurchaseOrder).options(
-            joinedload(BusinessDocument.line_items)
+            contains_eager(BusinessDocument.purchase_order),
+            selectinload(BusinessDocument.line_items)
         ).filter(
             BusinessDocument.document_type == DocumentType.PURCHASE_ORDER
         ).order_by(
             BusinessDocument.date.desc()
         ).offset(offset).limit(limit).all()
-        
+
         result = []
         for po_doc in pos:
             po_dict = po_doc.to_dict()
-            
-            # Get PO specific details
-            po_details = session.query(PurchaseOrder).filter(
-                PurchaseOrder.document_id == po_doc.id
-            ).first()
-            
+
+            # PO specific details come from the eagerly joined row
+            po_details = po_doc.purchase_order
+
             if po_details:
                 po_dict['total_amount'] = float(po_details.total_amount) if po_details.total_amount else None
                 po_dict['po_number'] = po_details.po_number
@@ -381,8 +419,8 @@ def store_parsed_document(
     from pathlib import Path
     
     with DatabaseSession(db_path) as session:
-        # Get or create vendor
-        vendor = get_or_create_vendor(session, document_data.vendor)
+        # Get or create vendor (cached id lookup, no SELECT on repeats)
+        vendor_id = _vendor_id_for_name(session, document_data.vendor)
         
         # Determine the appropriate date for this document type
         document_date = document_data.date
@@ -408,7 +446,8 @@ def store_parsed_document(
             extraction_method=document_data.extraction_method,
             raw_text=document_data.raw_text,
             extraction_metadata=document_data.metadata,
-            status="extracted"
+            status="extracted",
+            line_items_count=len(document_data.line_items) if document_data.line_items else 0
         )
         
         session.add(business_doc)
@@ -446,63 +485,116 @@ def store_parsed_document(
             )
             session.add(receipt)
         
-        # Store line items if present
+        # Store line items if present, as one executemany insert instead
+        # of per-item ORM objects going through the unit of work
         if document_data.line_items:
-            for i, item_data in enumerate(document_data.line_items):
-                line_item = DocumentLineItem(
-                    document_id=business_doc.id,
-                    item_description=item_data.get('item_description', ''),
-                    quantity=item_data.get('quantity', 0),
-                    unit_price=Decimal(str(item_data.get('unit_price', 0))),
-                    line_total=Decimal(str(item_data.get('line_total', 0))),
-                    line_number=i + 1,
-                    extraction_confidence=Decimal(str(item_data.get('extraction_confidence', 0.0)))
-                )
-                session.add(line_item)
+            session.execute(
+                insert(DocumentLineItem),
+                [
+                    {
+                        "document_id": business_doc.id,
+                        "item_description": item_data.get('item_description', ''),
+                        "quantity": item_data.get('quantity', 0),
+                        "unit_price": Decimal(str(item_data.get('unit_price', 0))),
+                        "line_total": Decimal(str(item_data.get('line_total', 0))),
+                        "line_number": i + 1,
+                        "extraction_confidence": Decimal(str(item_data.get('extraction_confidence', 0.0)))
+                    }
+                    for i, item_data in enumerate(document_data.line_items)
+                ]
+            )
         
         # Update vendor statistics
-        update_vendor_statistics(session, vendor, document_data)
+        update_vendor_statistics(session, vendor_id, document_data)
         
         session.commit()
         return business_doc.id
 
 
 def get_or_create_vendor(session: Session, vendor_name: str) -> Vendor:
-    """Get or create vendor record"""
+    """Get or create vendor record
+
+    Vendor.name is uniquely indexed, so the lookup is a B-tree seek; on a
+    miss the insert goes through ON CONFLICT DO NOTHING, which also makes
+    concurrent creation of the same vendor safe.
+    """
     from .models import normalize_vendor_name
-    
+
     if not vendor_name:
         vendor_name = "Unknown Vendor"
-    
-    # Check if vendor exists
+
+    # Check if vendor exists (indexed seek, the common case)
     vendor = session.query(Vendor).filter_by(name=vendor_name).first()
-    
+
     if not vendor:
-        # Create new vendor
-        vendor = Vendor(
-            name=vendor_name,
-            normalized_name=normalize_vendor_name(vendor_name)
+        # Create new vendor; ON CONFLICT ignores a concurrent insert
+        session.execute(
+            _vendor_insert_stmt(session).values(
+                name=vendor_name,
+                normalized_name=normalize_vendor_name(vendor_name)
+            )
         )
-        session.add(vendor)
-        session.flush()
-    
+        vendor = session.query(Vendor).filter_by(name=vendor_name).one()
+
     return vendor
 
 
-def update_vendor_statistics(session: Session, vendor: Vendor, document_data):
-    """Update vendor statistics"""
-    vendor.total_documents += 1
-    
+# Vendor ids keyed on the exact vendor name — the unique column and
+# what get_or_create_vendor looks up. Normalizing the key would merge
+# distinct vendors ("Acme Inc." and "Acme LLC" both normalize to
+# "Acme") and credit one vendor's statistics to the other. Vendors
+# repeat heavily across documents, so this skips one SELECT per stored
+# document after the first; reset_connection clears it alongside the
+# engine.
+_vendor_id_cache: Dict[str, int] = {}
+
+
+def _vendor_id_for_name(session: Session, vendor_name: str) -> int:
+    """Resolve a vendor name to its id, creating the vendor if needed"""
+    if not vendor_name:
+        vendor_name = "Unknown Vendor"
+
+    vendor_id = _vendor_id_cache.get(vendor_name)
+    if vendor_id is None:
+        vendor_id = get_or_create_vendor(session, vendor_name).id
+        _vendor_id_cache[vendor_name] = vendor_id
+    return vendor_id
+
+
+def _vendor_insert_stmt(session: Session):
+    """Vendor INSERT that ignores conflicts on name where supported"""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(Vendor).on_conflict_do_nothing(index_elements=["name"])
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(Vendor).on_conflict_do_nothing(index_elements=["name"])
+    from sqlalchemy import insert
+    return insert(Vendor)
+
+
+def update_vendor_statistics(session: Session, vendor_id: int, document_data):
+    """Update vendor statistics
+
+    One atomic UPDATE with server-side increments: no vendor row is read
+    into the session, and concurrent writers cannot lose updates the way
+    the previous read-modify-write did.
+    """
+    values = {"total_documents": Vendor.total_documents + 1}
+
     if document_data.document_type.value == 'purchase_order':
-        vendor.total_orders += 1
+        values["total_orders"] = Vendor.total_orders + 1
     elif document_data.document_type.value == 'invoice':
-        vendor.total_invoices += 1
+        values["total_invoices"] = Vendor.total_invoices + 1
     elif document_data.document_type.value == 'receipt':
-        vendor.total_receipts += 1
-    
+        values["total_receipts"] = Vendor.total_receipts + 1
+
     # Update total amount if available
-    if hasattr(document_data, 'total_amount') and document_data.total_amount:
-        vendor.total_amount += document_data.total_amount
+    if getattr(document_data, 'total_amount', None):
+        values["total_amount"] = Vendor.total_amount + document_data.total_amount
+
+    session.execute(update(Vendor).where(Vendor.id == vendor_id).values(**values))
 
 
 def initialize_database(db_path: Optional[str] = None) -> str:
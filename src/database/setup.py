@@ -7,6 +7,7 @@ Creates SQLite database with all required tables.
 import os
 import sqlite3
 import sys
+import time
 from typing import Optional
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
@@ -61,8 +62,8 @@ def initialize_database(db_path: Optional[str] = None) -> str:
         """))
         
         conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS idx_business_documents_type_date 
-            ON business_documents(document_type, date)
+            CREATE INDEX IF NOT EXISTS idx_business_documents_type_date
+            ON business_documents(document_type, date, created_at)
         """))
         
         # Cross-reference indexes
@@ -72,10 +73,94 @@ def initialize_database(db_path: Optional[str] = None) -> str:
         """))
         
         conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS idx_receipts_reference_po 
+            CREATE INDEX IF NOT EXISTS idx_receipts_reference_po
             ON receipts(reference_po)
         """))
-        
+
+        # Commit the core indexes before the dialect-specific extras: a
+        # failure below (e.g. no privilege for CREATE EXTENSION) aborts
+        # the open transaction, and its rollback must not discard them
+        conn.commit()
+
+        # Full-text search index for document search (SQLite only).
+        # FTS5 is an inverted index, so search_business_documents can
+        # resolve matches via index lookup instead of LIKE-scanning
+        # three columns of the whole table; triggers keep it in sync.
+        if engine.dialect.name == 'sqlite':
+            # Databases created before the denormalized line-item
+            # counter get the column added and backfilled in place
+            columns = {row[1] for row in conn.execute(
+                text("PRAGMA table_info(business_documents)"))}
+            if 'line_items_count' not in columns:
+                conn.execute(text("""
+                    ALTER TABLE business_documents
+                    ADD COLUMN line_items_count INTEGER NOT NULL DEFAULT 0
+                """))
+                conn.execute(text("""
+                    UPDATE business_documents SET line_items_count = (
+                        SELECT COUNT(*) FROM document_line_items
+                        WHERE document_id = business_documents.id
+                    )
+                """))
+
+            conn.execute(text("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS business_documents_fts
+                USING fts5(
+                    document_number, vendor, pdf_filename,
+                    content='business_documents', content_rowid='id'
+                )
+            """))
+            conn.execute(text("""
+                CREATE TRIGGER IF NOT EXISTS business_documents_fts_ai
+                AFTER INSERT ON business_documents BEGIN
+                    INSERT INTO business_documents_fts(rowid, document_number, vendor, pdf_filename)
+                    VALUES (new.id, new.document_number, new.vendor, new.pdf_filename);
+                END
+            """))
+            conn.execute(text("""
+                CREATE TRIGGER IF NOT EXISTS business_documents_fts_ad
+                AFTER DELETE ON business_documents BEGIN
+                    INSERT INTO business_documents_fts(business_documents_fts, rowid, document_number, vendor, pdf_filename)
+                    VALUES ('delete', old.id, old.document_number, old.vendor, old.pdf_filename);
+                END
+            """))
+            conn.execute(text("""
+                CREATE TRIGGER IF NOT EXISTS business_documents_fts_au
+                AFTER UPDATE ON business_documents BEGIN
+                    INSERT INTO business_documents_fts(business_documents_fts, rowid, document_number, vendor, pdf_filename)
+                    VALUES ('delete', old.id, old.document_number, old.vendor, old.pdf_filename);
+                    INSERT INTO business_documents_fts(rowid, document_number, vendor, pdf_filename)
+                    VALUES (new.id, new.document_number, new.vendor, new.pdf_filename);
+                END
+            """))
+            # Index any rows that predate the FTS table
+            conn.execute(text("""
+                INSERT INTO business_documents_fts(business_documents_fts)
+                VALUES ('rebuild')
+            """))
+
+        elif engine.dialect.name == 'postgresql':
+            # Trigram GIN indexes let the ILIKE '%query%' search
+            # predicates use an index instead of scanning the table.
+            # Needs the pg_trgm extension; without the privilege to
+            # create it, the rollback below costs only these trigram
+            # indexes and search keeps its sequential-scan path
+            try:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for column in ("document_number", "vendor", "pdf_filename"):
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_business_documents_{column}_trgm "
+                        f"ON business_documents USING gin ({column} gin_trgm_ops)"
+                    ))
+            except Exception:
+                conn.rollback()
+
+        # Refresh planner statistics so the indexes above actually get
+        # picked; PRAGMA optimize additionally lets SQLite self-tune
+        conn.execute(text("ANALYZE"))
+        if engine.dialect.name == 'sqlite':
+            conn.execute(text("PRAGMA optimize"))
+
         conn.commit()
     
     # Return appropriate identifier
@@ -102,6 +187,40 @@ def seed_sample_data(db_path: Optional[str] = None) -> None:
     return
 
 
+def backup_database(backup_path: Optional[str] = None, db_path: Optional[str] = None) -> str:
+    """Back up the SQLite database using the online backup API
+
+    sqlite3.Connection.backup copies pages incrementally under a read
+    transaction, so an active WAL writer is neither blocked nor torn the
+    way a plain file copy of the database would be.
+    """
+    database_url = get_database_url(db_path)
+    if not database_url.startswith('sqlite:///'):
+        raise ValueError("backup_database only supports SQLite databases")
+
+    sqlite_path = database_url.replace('sqlite:///', '')
+    if backup_path is None:
+        # Plain %-formatting skips strftime's format-string interpreter
+        # and timezone lookup, which matters on tight backup cadences
+        now = time.gmtime()
+        timestamp = "%04d%02d%02d_%02d%02d%02d" % (
+            now.tm_year, now.tm_mon, now.tm_mday,
+            now.tm_hour, now.tm_min, now.tm_sec
+        )
+        backup_path = f"{sqlite_path}.{timestamp}.bak"
+
+    source = sqlite3.connect(sqlite_path)
+    target = sqlite3.connect(backup_path)
+    try:
+        with target:
+            source.backup(target, pages=1000)
+    finally:
+        source.close()
+        target.close()
+
+    return backup_path
+
+
 def get_database_info(db_path: Optional[str] = None) -> dict:
     """Get information about the database"""
     database_url = get_database_url(db_path)
@@ -134,16 +253,21 @@ def get_database_info(db_path: Optional[str] = None) -> dict:
                 # For cloud databases, file size is not applicable
                 file_size = None
             
-            table_info = {}
-            for table in tables:
-                table_name = table[0]
+            # Count every table in one UNION ALL round trip instead of a
+            # COUNT(*) query per table; names come from the catalog, so
+            # interpolating them is safe
+            table_names = [table[0] for table in tables]
+            table_info = {name: 0 for name in table_names}
+            if table_names:
+                count_query = " UNION ALL ".join(
+                    f"SELECT '{name}' AS table_name, COUNT(*) AS n FROM {name}"
+                    for name in table_names
+                )
                 try:
-                    count_result = conn.execute(text(f"SELECT COUNT(*) FROM {table_name}")).fetchone()
-                    count = count_result[0] if count_result else 0
-                    table_info[table_name] = count
-                except Exception as e:
-                    # If table doesn't exist or other error, mark as 0
-                    table_info[table_name] = 0
+                    table_info.update(conn.execute(text(count_query)).all())
+                except Exception:
+                    # Leave any uncountable tables at 0
+                    pass
         
         result = {
             "database_url": database_url[:50] + "..." if len(database_url) > 50 else database_url,
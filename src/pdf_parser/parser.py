@@ -57,6 +57,7 @@ import re
 import pypdf
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from decimal import Decimal
@@ -177,6 +178,140 @@ class ReceiptData(DocumentData):
             self.document_number = self.receipt_id
 
 
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile and cache a pattern, so runtime-supplied patterns (e.g.
+    from extraction templates) are compiled at most once per process"""
+    return re.compile(pattern, flags)
+
+
+# Patterns compiled once at module import. Parsing is the hot path:
+# every field extraction used to funnel raw strings through re.search,
+# paying a cache lookup (or full recompilation) per pattern per PDF.
+_DOCUMENT_TYPE_PATTERNS = {
+    DocumentType.PURCHASE_ORDER: tuple(_compile_pattern(p) for p in (
+        r'Purchase\s+Order',
+        r'PO\s+Number',
+        r'P\.O\.\s+Number'
+    )),
+    DocumentType.INVOICE: tuple(_compile_pattern(p) for p in (
+        r'Invoice',
+        r'Invoice\s+Number',
+        r'INV[-\s]?\d+'
+    )),
+    DocumentType.RECEIPT: tuple(_compile_pattern(p) for p in (
+        r'Receipt',
+        r'Delivery\s+Receipt',
+        r'Receipt\s+ID',
+        r'RCPT[-\s]?\d+'
+    ))
+}
+
+_EXTRACTION_FLAGS = re.IGNORECASE | re.MULTILINE
+
+_EXTRACTION_PATTERNS = {
+    # Purchase Order patterns
+    'po_number': (
+        r'PO[-\s]?Number:?\s*([A-Z0-9-]+)',
+        r'Purchase\s+Order:?\s*([A-Z0-9-]+)',
+        r'P\.O\.?\s*:?\s*([A-Z0-9-]+)',
+        r'Order\s+Number:?\s*([A-Z0-9-]+)',
+        r'(PO[-]?\d{3,6})'  # Generic PO pattern
+    ),
+
+    # Invoice patterns
+    'invoice_number': (
+        r'Invoice[-\s]?Number:?\s*([A-Z0-9-]+)',
+        r'Invoice:?\s*([A-Z0-9-]+)',
+        r'INV[-\s]?Number:?\s*([A-Z0-9-]+)',
+        r'(INV[-]?\d{3,6})'  # Generic INV pattern
+    ),
+
+    # Receipt patterns
+    'receipt_id': (
+        r'Receipt[-\s]?ID:?\s*([A-Z0-9-]+)',
+        r'Receipt:?\s*([A-Z0-9-]+)',
+        r'RCPT[-\s]?ID:?\s*([A-Z0-9-]+)',
+        r'(RCPT[-]?\d{3,6})'  # Generic RCPT pattern
+    ),
+
+    # Common patterns. The vendor capture deliberately avoids the
+    # classic ReDoS shape `\s*` + lazy class containing \s + anchor:
+    # label whitespace is [ \t]*, the first captured character is
+    # non-blank (so the two runs have a unique split), and the greedy
+    # class has no trailing anchor to backtrack into. Matching stays
+    # linear even on multi-megabyte whitespace runs, where the previous
+    # form went quadratic.
+    'vendor': (
+        r'Vendor:?[ \t]*([A-Za-z&.,\'-][A-Za-z \t&.,\'-]*)',
+        r'Supplier:?[ \t]*([A-Za-z&.,\'-][A-Za-z \t&.,\'-]*)',
+        r'Company:?[ \t]*([A-Za-z&.,\'-][A-Za-z \t&.,\'-]*)',
+        r'Bill\s+To:?[ \t]*([A-Za-z&.,\'-][A-Za-z \t&.,\'-]*)'
+    ),
+
+    'date': (
+        r'Date:?\s*(\d{4}-\d{2}-\d{2})',
+        r'Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'Order\s+Date:?\s*(\d{4}-\d{2}-\d{2})',
+        r'Order\s+Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'Invoice\s+Date:?\s*(\d{4}-\d{2}-\d{2})',
+        r'Invoice\s+Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'(\d{4}-\d{2}-\d{2})'  # Generic ISO date
+    ),
+
+    'date_received': (
+        r'Date\s+Received:?\s*(\d{4}-\d{2}-\d{2})',
+        r'Date\s+Received:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'Received:?\s*(\d{4}-\d{2}-\d{2})',
+        r'Received:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
+    ),
+
+    'reference_po': (
+        r'Reference\s+PO:?\s*([A-Z0-9-]+)',
+        r'PO\s+Reference:?\s*([A-Z0-9-]+)',
+        r'Original\s+PO:?\s*([A-Z0-9-]+)',
+        r'Ref\.?\s+PO:?\s*([A-Z0-9-]+)'
+    ),
+
+    'total': (
+        r'Total:?\s*\$?([0-9,]+\.?\d{0,2})',
+        r'Grand\s+Total:?\s*\$?([0-9,]+\.?\d{0,2})',
+        r'Amount:?\s*\$?([0-9,]+\.?\d{0,2})',
+        r'Sum:?\s*\$?([0-9,]+\.?\d{0,2})'
+    ),
+
+    'item': (
+        r'Item:?\s*([A-Za-z\s\-&.,]+)',
+        r'Description:?\s*([A-Za-z\s\-&.,]+)',
+        r'Product:?\s*([A-Za-z\s\-&.,]+)'
+    ),
+
+    'quantity': (
+        r'Quantity:?\s*(\d+)',
+        r'Qty:?\s*(\d+)',
+        r'Amount:?\s*(\d+)\s*(?:EA|Each|Units?)',
+        r'(\d+)\s*(?:EA|Each|Units?)'
+    ),
+
+    'quantity_received': (
+        r'Quantity\s+Received:?\s*(\d+)',
+        r'Qty\s+Received:?\s*(\d+)',
+        r'Received:?\s*(\d+)\s*(?:EA|Each|Units?)'
+    ),
+
+    'unit_price': (
+        r'Unit\s+Price:?\s*\$?([0-9,]+\.?\d{0,2})',
+        r'Price:?\s*\$?([0-9,]+\.?\d{0,2})',
+        r'Rate:?\s*\$?([0-9,]+\.?\d{0,2})'
+    )
+}
+
+_COMPILED_EXTRACTION_PATTERNS = {
+    field: tuple(_compile_pattern(p, _EXTRACTION_FLAGS) for p in patterns)
+    for field, patterns in _EXTRACTION_PATTERNS.items()
+}
+
+
 class BusinessDocumentPDFParser:
     """
     PDF parser for business documents (Purchase Orders, Invoices, Receipts)
@@ -191,122 +326,16 @@ class BusinessDocumentPDFParser:
     
     def __init__(self):
         self.supported_extensions = ['.pdf']
-        
-        # Document type detection patterns
+
+        # Document type detection patterns, precompiled at module import
         # AUDIT: These hardcoded patterns are brittle and hard to maintain
         # IMPROVEMENT: Move to external configuration file with documentation
-        self.document_type_patterns = {
-            DocumentType.PURCHASE_ORDER: [
-                r'Purchase\s+Order',
-                r'PO\s+Number',
-                r'P\.O\.\s+Number'
-            ],
-            DocumentType.INVOICE: [
-                r'Invoice',
-                r'Invoice\s+Number',
-                r'INV[-\s]?\d+'
-            ],
-            DocumentType.RECEIPT: [
-                r'Receipt',
-                r'Delivery\s+Receipt',
-                r'Receipt\s+ID',
-                r'RCPT[-\s]?\d+'
-            ]
-        }
-        
-        # Regex patterns for extracting document data
+        self.document_type_patterns = _DOCUMENT_TYPE_PATTERNS
+
+        # Regex patterns for extracting document data, precompiled at
+        # module import so no parse ever re-pays compilation
         # SECURITY ISSUE: Complex regex patterns could be vulnerable to ReDoS attacks
-        # MAINTAINABILITY: This massive dictionary is hard to understand and modify
-        self.extraction_patterns = {
-            # Purchase Order patterns
-            'po_number': [
-                r'PO[-\s]?Number:?\s*([A-Z0-9-]+)',
-                r'Purchase\s+Order:?\s*([A-Z0-9-]+)',
-                r'P\.O\.?\s*:?\s*([A-Z0-9-]+)',
-                r'Order\s+Number:?\s*([A-Z0-9-]+)',
-                r'(PO[-]?\d{3,6})'  # Generic PO pattern
-            ],
-            
-            # Invoice patterns
-            'invoice_number': [
-                r'Invoice[-\s]?Number:?\s*([A-Z0-9-]+)',
-                r'Invoice:?\s*([A-Z0-9-]+)',
-                r'INV[-\s]?Number:?\s*([A-Z0-9-]+)',
-                r'(INV[-]?\d{3,6})'  # Generic INV pattern
-            ],
-            
-            # Receipt patterns
-            'receipt_id': [
-                r'Receipt[-\s]?ID:?\s*([A-Z0-9-]+)',
-                r'Receipt:?\s*([A-Z0-9-]+)',
-                r'RCPT[-\s]?ID:?\s*([A-Z0-9-]+)',
-                r'(RCPT[-]?\d{3,6})'  # Generic RCPT pattern
-            ],
-            
-            # Common patterns
-            'vendor': [
-                r'Vendor:?\s*([A-Za-z\s&.,\'-]+?)(?:\n|$)',
-                r'Supplier:?\s*([A-Za-z\s&.,\'-]+?)(?:\n|$)',
-                r'Company:?\s*([A-Za-z\s&.,\'-]+?)(?:\n|$)',
-                r'Bill\s+To:?\s*([A-Za-z\s&.,\'-]+?)(?:\n|$)'
-            ],
-            
-            'date': [
-                r'Date:?\s*(\d{4}-\d{2}-\d{2})',
-                r'Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'Order\s+Date:?\s*(\d{4}-\d{2}-\d{2})',
-                r'Order\s+Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'Invoice\s+Date:?\s*(\d{4}-\d{2}-\d{2})',
-                r'Invoice\s+Date:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'(\d{4}-\d{2}-\d{2})'  # Generic ISO date
-            ],
-            
-            'date_received': [
-                r'Date\s+Received:?\s*(\d{4}-\d{2}-\d{2})',
-                r'Date\s+Received:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-                r'Received:?\s*(\d{4}-\d{2}-\d{2})',
-                r'Received:?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-            ],
-            
-            'reference_po': [
-                r'Reference\s+PO:?\s*([A-Z0-9-]+)',
-                r'PO\s+Reference:?\s*([A-Z0-9-]+)',
-                r'Original\s+PO:?\s*([A-Z0-9-]+)',
-                r'Ref\.?\s+PO:?\s*([A-Z0-9-]+)'
-            ],
-            
-            'total': [
-                r'Total:?\s*\$?([0-9,]+\.?\d{0,2})',
-                r'Grand\s+Total:?\s*\$?([0-9,]+\.?\d{0,2})',
-                r'Amount:?\s*\$?([0-9,]+\.?\d{0,2})',
-                r'Sum:?\s*\$?([0-9,]+\.?\d{0,2})'
-            ],
-            
-            'item': [
-                r'Item:?\s*([A-Za-z\s\-&.,]+)',
-                r'Description:?\s*([A-Za-z\s\-&.,]+)',
-                r'Product:?\s*([A-Za-z\s\-&.,]+)'
-            ],
-            
-            'quantity': [
-                r'Quantity:?\s*(\d+)',
-                r'Qty:?\s*(\d+)',
-                r'Amount:?\s*(\d+)\s*(?:EA|Each|Units?)',
-                r'(\d+)\s*(?:EA|Each|Units?)'
-            ],
-            
-            'quantity_received': [
-                r'Quantity\s+Received:?\s*(\d+)',
-                r'Qty\s+Received:?\s*(\d+)',
-                r'Received:?\s*(\d+)\s*(?:EA|Each|Units?)'
-            ],
-            
-            'unit_price': [
-                r'Unit\s+Price:?\s*\$?([0-9,]+\.?\d{0,2})',
-                r'Price:?\s*\$?([0-9,]+\.?\d{0,2})',
-                r'Rate:?\s*\$?([0-9,]+\.?\d{0,2})'
-            ]
-        }
+        self.extraction_patterns = _COMPILED_EXTRACTION_PATTERNS
     
     def parse_document(self, file_path: str) -> Union[PurchaseOrderData, InvoiceData, ReceiptData, DocumentData]:
         """
@@ -372,7 +401,7 @@ class BusinessDocumentPDFParser:
         # Check for each document type
         for doc_type, patterns in self.document_type_patterns.items():
             for pattern in patterns:
-                if re.search(pattern, text_upper, re.IGNORECASE):
+                if pattern.search(text_upper):
                     return doc_type
         
         return DocumentType.UNKNOWN
@@ -485,10 +514,10 @@ class BusinessDocumentPDFParser:
     
     def _extract_field(self, text: str, field_name: str) -> Optional[str]:
         """Extract a specific field using regex patterns"""
-        patterns = self.extraction_patterns.get(field_name, [])
-        
+        patterns = self.extraction_patterns.get(field_name, ())
+
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
                 result = match.group(1).strip()
                 logger.debug(f"Extracted {field_name}: {result}")